@@ -12,6 +12,8 @@ This script allows the user to process and analyze a CSV file of a specific desi
  * and finally, extracts at least one country and the associated data into a subset CSV file.
 
 The script requires that `NumPy` and `Matplotlib` be installed within the Python environment the script is run in.
+If `Numba` is installed as well, it is used to speed up the verification of the file's structure (it is imported
+only when the structure is verified).
 According to vermin, the minimum required version of Python to run the script is 3.6. This file can also be imported
 as a module.
 
@@ -24,13 +26,309 @@ The specific design mentioned above is that:
 Created in the course of the guru99 Python project, with the constraint that `pandas` could not be used
 in the implementation. As a **beginner**, I found it very challenging. However, in the end, it was a very satisfactory
 exercise, as well. I'm not planning on expanding the design at the moment.
+
+The inputs can also be provided as command-line arguments, in which case the script doesn't prompt for them, e.g.:
+    python EmissionsAnalyzer.py file.csv --year 2000 --country France,Germany --extract France --overwrite
+Many files can be analyzed and extracted from in parallel by listing them in a text file, e.g.:
+    python EmissionsAnalyzer.py --batch files.txt --year 2000 --extract France,Germany
 """
 
+import argparse
 import csv
+import multiprocessing
+import os
+import re
+from collections import deque
+from itertools import chain
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.ticker import FormatStrFormatter
-from os.path import exists, splitext
+from matplotlib.ticker import FuncFormatter
+from os.path import basename, dirname, exists, splitext
+
+
+# Words whose case should be lowered after capitalizing each word in a country's name.
+_TITLE_FIXES = {" And ": " and ", "D'": "d'"}
+_TITLE_FIXES_RE = re.compile("|".join(map(re.escape, _TITLE_FIXES)))
+
+# Pattern of the values expected in the first row (years).
+_INT_RE = re.compile(r" *[+-]?\d+ *")
+
+# Characters omitted when checking whether a country's name consists of letters.
+_NAME_PUNCTUATION = str.maketrans("", "", "-' ")
+
+
+def _fix_title(match: re.Match) -> str:
+    """
+    Returns the replacement for a word matched by _TITLE_FIXES_RE.
+
+    Args:
+        match (re.Match): A match of _TITLE_FIXES_RE.
+
+    Returns:
+        str
+    """
+
+    return _TITLE_FIXES[match.group(0)]
+
+
+def _first_field(line: str) -> str:
+    """
+    Returns the first value of a CSV line, without parsing the rest of the line.
+
+    Args:
+        line (str): A line of a CSV file.
+
+    Returns:
+        str
+    """
+
+    # A quoted value can contain commas, so let csv.reader parse such a line.
+    if line.startswith('"'):
+        return next(csv.reader([line]))[0]
+    return line.partition(",")[0]
+
+
+def _split_line(line: str) -> list[str]:
+    """
+    Splits a CSV line into its values.
+
+    Args:
+        line (str): A line of a CSV file.
+
+    Returns:
+        list[str]: The values of the line.
+    """
+
+    # Only a line with quoted values needs csv.reader; any other line can be simply split at the commas.
+    if '"' in line:
+        return next(csv.reader([line]))
+    return line.split(",")
+
+
+def _parse_float(value: str) -> float:
+    """
+    Casts a string into a float, or returns NaN if that is not possible.
+
+    Args:
+        value (str): A string to cast.
+
+    Returns:
+        float
+    """
+
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
+def _parse_floats(values: list, count: int) -> np.ndarray:
+    """
+    Casts a list of strings into a NumPy array of floats. Values that cannot be cast are replaced with NaN.
+    A list shorter than count is padded with NaN; the values beyond count are omitted.
+
+    Args:
+        values (list): A list of strings to cast.
+        count (int): The expected number of values.
+
+    Returns:
+        np.ndarray: An array of floats of length count.
+    """
+
+    if len(values) < count:
+        values = values + [""] * (count - len(values))
+
+    try:
+        return np.fromiter(values, dtype=np.float64, count=count)
+    except ValueError:
+        return np.fromiter(map(_parse_float, values), dtype=np.float64, count=count)
+
+
+# The special values accepted by float(), as lowercase bytes.
+_NAN = np.frombuffer(b"nan", dtype=np.uint8)
+_INF = np.frombuffer(b"inf", dtype=np.uint8)
+_INFINITY = np.frombuffer(b"infinity", dtype=np.uint8)
+
+
+def _matches_word(buf: np.ndarray, start: int, end: int, word: np.ndarray) -> bool:
+    """
+    Checks whether the bytes of buf between start and end (exclusive) make up the word, regardless of their case.
+
+    Args:
+        buf (np.ndarray): An array of bytes (np.uint8).
+        start (int): The index of the first byte to compare.
+        end (int): The index after the last byte to compare.
+        word (np.ndarray): A lowercase word as an array of bytes (np.uint8).
+
+    Returns:
+        bool
+    """
+
+    if end - start != len(word):
+        return False
+    for k in range(len(word)):
+        # Setting the 0x20 bit lowers the case of an ASCII letter.
+        if buf[start + k] | 32 != word[k]:
+            return False
+    return True
+
+
+def _is_number(buf: np.ndarray, start: int, end: int, integer: bool) -> bool:
+    """
+    Checks whether the bytes of buf between start and end (exclusive) make up a number.
+
+    Args:
+        buf (np.ndarray): An array of bytes (np.uint8).
+        start (int): The index of the first byte of the number.
+        end (int): The index after the last byte of the number.
+        integer (bool): If True, only an integer is accepted; else, a decimal number, optionally with an exponent.
+
+    Returns:
+        bool
+    """
+
+    # Omit any double quotes surrounding the number, and any whitespace both outside and inside of them,
+    # as float() would strip it from the unquoted value.
+    for _ in range(2):
+        while start < end and (buf[start] == 32 or 9 <= buf[start] <= 13):
+            start += 1
+        while end > start and (buf[end - 1] == 32 or 9 <= buf[end - 1] <= 13):
+            end -= 1
+        if end - start >= 2 and buf[start] == 34 and buf[end - 1] == 34:
+            start += 1
+            end -= 1
+        else:
+            break
+
+    i = start
+    digits = 0
+
+    # Optional sign, followed by the digits of the integer part.
+    if i < end and (buf[i] == 43 or buf[i] == 45):
+        i += 1
+
+    # Like float(), accept the special values, regardless of their case.
+    if not integer and (_matches_word(buf, i, end, _NAN) or _matches_word(buf, i, end, _INF)
+                        or _matches_word(buf, i, end, _INFINITY)):
+        return True
+
+    while i < end and 48 <= buf[i] <= 57:
+        i += 1
+        digits += 1
+
+    if not integer:
+        # Optional decimal point, followed by the digits of the fractional part.
+        if i < end and buf[i] == 46:
+            i += 1
+            while i < end and 48 <= buf[i] <= 57:
+                i += 1
+                digits += 1
+
+        # Optional exponent, which must have at least one digit.
+        if digits > 0 and i < end and (buf[i] == 69 or buf[i] == 101):
+            i += 1
+            if i < end and (buf[i] == 43 or buf[i] == 45):
+                i += 1
+            exp_digits = 0
+            while i < end and 48 <= buf[i] <= 57:
+                i += 1
+                exp_digits += 1
+            if exp_digits == 0:
+                return False
+
+    return digits > 0 and i == end
+
+
+def _scan_numbers(buf: np.ndarray) -> bool:
+    """
+    Checks whether all the values of a CSV file, except for its first column, are numbers.
+    The values of the first row must be integers; the values of the following rows can be decimal numbers.
+
+    Args:
+        buf (np.ndarray): The contents of the file as an array of bytes (np.uint8).
+
+    Returns:
+        bool
+    """
+
+    n = len(buf)
+    row = 0
+    col = 0
+    start = 0
+    quoted = False
+    for i in range(n + 1):
+        # The end of the buffer is treated as the end of a row.
+        sep = buf[i] if i < n else 10
+
+        # Commas within double quotes don't separate values.
+        if sep == 34:
+            quoted = not quoted
+        if quoted or (sep != 44 and sep != 10):
+            continue
+
+        # Omit the carriage return of a Windows-style line ending.
+        end = i
+        if end > start and buf[end - 1] == 13:
+            end -= 1
+
+        if col > 0 and not _is_number(buf, start, end, row == 0):
+            return False
+
+        if sep == 44:
+            col += 1
+        else:
+            row += 1
+            col = 0
+        start = i + 1
+    return True
+
+
+def _check_numbers(rows) -> bool:
+    """
+    Checks whether all the values of CSV rows, except for the first column, are numbers, by casting them.
+    The values of the first row must be integers; the values of the following rows can be decimal numbers.
+
+    Args:
+        rows: An iterator of the rows of a CSV file, each being a list of strings.
+
+    Returns:
+        bool
+    """
+
+    # The casted numbers are consumed by a zero-length deque, so that no list of them is built.
+    try:
+        deque(map(int, next(rows)[1:]), maxlen=0)
+        for row in rows:
+            deque(map(float, row[1:]), maxlen=0)
+    except ValueError:
+        return False
+    return True
+
+
+# _scan_numbers compiled by _compile_scan_numbers, or False if Numba isn't installed.
+_compiled_scan_numbers = None
+
+
+def _compile_scan_numbers():
+    """
+    Compiles _scan_numbers with Numba on the first call, so that Numba is imported only when it's needed.
+
+    Returns:
+        The compiled _scan_numbers, or None if Numba isn't installed.
+    """
+
+    global _matches_word, _is_number, _compiled_scan_numbers
+    if _compiled_scan_numbers is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _compiled_scan_numbers = False
+        else:
+            # The functions call each other by their global names, so these must refer to the compiled functions.
+            _matches_word = njit(cache=True)(_matches_word)
+            _is_number = njit(cache=True)(_is_number)
+            _compiled_scan_numbers = njit(cache=True)(_scan_numbers)
+    return _compiled_scan_numbers or None
 
 
 class AnalysisCSV:
@@ -38,15 +336,26 @@ class AnalysisCSV:
     A class used to conveniently process the data in a CSV file.
 
     Methods:
+        @staticmethod
+        check_file(user_inp: str) -> str:
+            Checks if a non-empty CSV file with the provided name exists, and returns its name.
+
         @staticmethod
         get_file(prompt: str) -> str:
             Prompts the user to enter a CSV filename, checks if a non-empty file like that exists, and returns its name.
 
         __init__(self, filename: str) -> None:
-            Initialize an object with the filename, data_dict, countries, first_key and first_value attributes.
+            Initialize an object with the filename, data_dict, countries, first_key, first_value, years and matrix
+            attributes.
+
+        check_year(self, user_inp: str) -> int:
+            Checks if the provided string is one of the years in self.first_value. Returns the year.
 
         get_year(prompt: str) -> int:
-            Prompts the user to enter a year in the range of self.first_value, inclusive. Returns the year.
+            Prompts the user to enter one of the years in self.first_value. Returns the year.
+
+        check_countries(self, user_inp: str, num: int, strict: bool = True) -> list[str]
+            Checks a comma-separated string of countries, and returns their list if they are correct.
 
         get_country(self, prompt: str, num: int, strict: bool = True) -> list[str]
             Prompts the user to enter a comma-separated string of countries and returns their list if they are correct.
@@ -57,13 +366,62 @@ class AnalysisCSV:
         visualize(self, countries_req: list) -> None
             Plots the data associated with the countries from the list. Displays an interactive plot.
 
+        year_summary(self, year: int) -> str
+            Finds the countries with the min and max emission levels in a year, and the year's average.
+
         analyze_year(self, year: int) -> None
             Finds and displays the countries with the min and max emission levels in a year, and the year's average.
 
         verify_structure(self) -> bool
-            Checks whether the data in the initialized dictionary is of the expected types.
+            Checks whether the data in the initialized object is of the expected types.
     """
 
+    @staticmethod
+    def check_file(user_inp: str) -> str:
+        """
+        Checks if a non-empty CSV file with the provided name exists, and returns its name.
+
+        Args:
+            user_inp (str): The name of a CSV file, with or without the ".csv" extension.
+
+        Returns:
+            str: The name of a non-empty CSV file.
+
+        Raises:
+            ValueError: If the file doesn't exist or cannot be read, has fewer than two rows, or its first row isn't
+                a range of years.
+        """
+
+        # If user's input doesn't include the ".csv" extension, append it.
+        if splitext(user_inp)[1].lower() != ".csv":
+            user_inp += ".csv"
+
+        try:
+            # Try to open the file. If it exists, save its first row and count its rows,
+            # but stop as soon as there are two of them.
+            with open(user_inp, newline="") as csvfile:
+                reader_len = 0
+                first_row = []
+                for row in csv.reader(csvfile):
+                    if not reader_len:
+                        first_row = row
+                    reader_len += 1
+                    if reader_len >= 2:
+                        break
+        except FileNotFoundError:
+            raise ValueError(f"There is no such file as: {user_inp}.")
+        except OSError as e:
+            raise ValueError(f"The file {user_inp} cannot be read ({e.strerror}).")
+
+        if reader_len < 2:
+            raise ValueError("The file must have at least two rows of data.")
+
+        # Check if the first row has at least one year after its first column, and all of them are integers.
+        if len(first_row) < 2 or not all(map(_INT_RE.fullmatch, first_row[1:])):
+            raise ValueError("The first row of the file must contain a range of years.")
+
+        return user_inp
+
     @staticmethod
     def get_file(prompt: str) -> str:
         """
@@ -77,57 +435,108 @@ class AnalysisCSV:
         """
 
         while True:
-            user_inp = input(prompt)
-
-            # If user's input doesn't include the ".csv" extension, append it.
-            if not user_inp.lower().endswith(".csv"):
-                user_inp += ".csv"
-
             try:
-                # Try to open the file. If it exists, save the number of rows in it into a variable.
-                with open(user_inp, newline="") as csvfile:
-                    reader_len = len(list(csv.reader(csvfile)))
-            except FileNotFoundError:
-                print(f"There is no such file as: {user_inp}. Try again.")
-                continue
-
-            if reader_len < 2:
-                print("The file must have at least two rows of data. Try again.")
-                continue
-
-            return user_inp
+                return AnalysisCSV.check_file(input(prompt))
+            except ValueError as e:
+                print(f"{e} Try again.")
 
     def __init__(self, filename: str) -> None:
         """
-        Initialize an object with the filename, data_dict, countries, first_key and first_value attributes.
+        Initialize an object with the filename, data_dict, countries, first_key, first_value, years and matrix
+        attributes.
+
+        The values are parsed only once into self.matrix, in which each row corresponds to a country in self.countries
+        and each column to a year in self.years. self.data_dict maps each country to its row index in self.matrix.
+        Any value that cannot be cast into a float is stored as NaN.
 
         Args:
             filename (str): The name of a non-empty CSV file.
 
         Returns:
             None
+
+        Raises:
+            ValueError: If the first row of the file isn't a range of years.
         """
 
         self.filename = filename
-        with open(filename, newline="") as csvfile:
-            reader = csv.reader(csvfile)
+        with open(filename) as csvfile:
+            # Read the non-empty lines of the file once; they are parsed below without creating a string per value.
+            header, *lines = [line for line in csvfile.read().split("\n") if line]
+
+        # Keep the lines, so that extract_to_file can copy them without parsing the file again.
+        self._header = header
+        self._lines = lines
+
+        # The first row holds the description of the file and the range of years.
+        self.first_key, *self.first_value = next(csv.reader([header]))
+
+        # Get a list of the countries from the first column of the following rows.
+        self.countries = [_first_field(line) for line in lines]
+
+        # The first row must have at least one year, and all of them must be integers.
+        if not self.first_value or not all(map(_INT_RE.fullmatch, self.first_value)):
+            raise ValueError("The first row of the file must contain a range of years.")
+        self.years = np.array([int(y) for y in self.first_value], dtype=np.int32)
+        self._countries_set = frozenset(self.countries)
+
+        # Map each year to its column in self.matrix, and save the range of years.
+        self._year_to_col = {y: i for i, y in enumerate(self.years.tolist())}
+        self._year_min = min(self._year_to_col)
+        self._year_max = max(self._year_to_col)
+
+        # Map each country to its row in self.matrix.
+        self.data_dict = {c: i for i, c in enumerate(self.countries)}
+
+        # Parse the values once into a single (countries x years) matrix of floats, using NumPy's parser.
+        # Like csv.reader, treat '#' as ordinary text rather than the start of a comment.
+        try:
+            self.matrix = np.loadtxt(lines, delimiter=",", quotechar='"', ndmin=2, comments=None,
+                                     usecols=range(1, len(self.years) + 1), dtype=np.float64)
+        except ValueError:
+            self.matrix = None
+
+        # If some of the values aren't numbers, or the rows don't match the countries, cast them row by row instead.
+        if self.matrix is None or self.matrix.shape[0] != len(self.countries):
+            self.matrix = np.empty((len(self.countries), len(self.years)), dtype=np.float64)
+            for i, row in enumerate(csv.reader(lines)):
+                self.matrix[i] = _parse_floats(row[1:], len(self.years))
+
+        print("All the data has been read into a matrix.\n")
+
+    def check_year(self, user_inp: str) -> int:
+        """
+        Checks if the provided string is one of the years in self.first_value. Returns the year.
 
-            # Import the data from the file into a dictionary attribute.
-            # The first element of each row is the key; the rest is the value.
-            self.data_dict = {row.pop(0): row for row in reader}
+        Args:
+            user_inp (str): A year to check.
 
-        # Get a list of the keys (countries) from the dictionary.
-        self.countries = list(self.data_dict.keys())
+        Returns:
+            int: The year.
 
-        # Get the first item from the list and the first value from the dictionary.
-        self.first_key = self.countries.pop(0)
-        self.first_value = self.data_dict.get(self.first_key)
+        Raises:
+            ValueError: If the string isn't an integer, or the year is not in the file.
+        """
 
-        print("All the data has been read into a dictionary.\n")
+        try:
+            # Try to cast the user's input into an integer.
+            year = int(user_inp)
+        except ValueError:
+            raise ValueError("You have not provided a year integer.")
+
+        # Check whether the provided year is one of the years in self.first_value.
+        # If some years are missing from the range, list all the years in the file instead of the range.
+        if year not in self._year_to_col:
+            if len(self._year_to_col) == self._year_max - self._year_min + 1:
+                years = f"{self._year_min}-{self._year_max}"
+            else:
+                years = ", ".join(map(str, sorted(self._year_to_col)))
+            raise ValueError(f"You have provided a year that is not in the file ({years}).")
+        return year
 
     def get_year(self, prompt: str) -> int:
         """
-        Prompts the user to enter a year in the range of self.first_value, inclusive. Returns the year.
+        Prompts the user to enter one of the years in self.first_value. Returns the year.
 
         Args:
             prompt (str): A message to display to the user.
@@ -137,21 +546,49 @@ class AnalysisCSV:
         """
 
         while True:
-            user_inp = input(prompt)
-
             try:
-                # Try to cast the user's input into an integer.
-                user_inp = int(user_inp)
-            except ValueError:
-                print("You have not provided a year integer. Try again.")
-                continue
-
-            # Check whether the provided year is within the range of years in self.first_value.
-            # This is done under the assumption the elements in that attribute are sorted.
-            if not int(self.first_value[0]) <= user_inp <= int(self.first_value[-1]):
-                print("You have provided an out-of-range year. Try again.")
-                continue
-            return user_inp
+                return self.check_year(input(prompt))
+            except ValueError as e:
+                print(f"{e} Try again.")
+
+    def check_countries(self, user_inp: str, num: int, strict: bool = True) -> list[str]:
+        """
+        Checks a comma-separated string of countries, and returns their list if they are correct.
+
+        Args:
+            user_inp (str): A comma-separated string of countries.
+            num (int): A number of countries to get.
+            strict (bool): If True, expects exactly the num of countries; else, from 1 to num. Defaults to True.
+
+        Returns:
+            list[str]: The list of countries.
+
+        Raises:
+            ValueError: If the number of countries is unexpected, or some of them are duplicate or incorrect.
+        """
+
+        countries = user_inp.split(",")
+        countries_len = len(countries)
+
+        # Check if the length of the above list is as demanded by the num and strict arguments.
+        if not ((strict and countries_len == num) or (not strict and 0 < countries_len <= num)):
+            raise ValueError(f"The provided input is unexpected (you must enter {('from 1 to ', 'exactly')[strict]} "
+                             f"{num} of countries).")
+
+        # Strip each item in the list of whitespace on each side and capitalize each word in the item.
+        # Also, lower the case of some words if they exists in the item.
+        countries = [_TITLE_FIXES_RE.sub(_fix_title, c.strip().title()) for c in countries]
+
+        # In a single pass, check for any duplicates using a set of the items seen so far,
+        # and check whether each item in the list is found in self.countries.
+        seen = set()
+        for c in countries:
+            if c in seen:
+                raise ValueError("You have entered some duplicate countries.")
+            if c not in self._countries_set:
+                raise ValueError("You have provided some incorrect names of countries.")
+            seen.add(c)
+        return countries
 
     def get_country(self, prompt: str, num: int, strict: bool = True) -> list[str]:
         """
@@ -167,29 +604,10 @@ class AnalysisCSV:
         """
 
         while True:
-            user_inp = input(prompt).split(",")
-            user_inp_len = len(user_inp)
-
-            # Check if the length of the above list is as demanded by the num and strict arguments.
-            if (strict and user_inp_len == num) or (not strict and 0 < user_inp_len <= num):
-                # Strip each item in the list of whitespace on each side and capitalize each word in the item.
-                # Also, lower the case of some words if they exists in the item.
-                user_inp = [c.strip().title().replace(" And ", " and ").replace("D'", "d'")
-                            for c in user_inp]
-
-                # Check for any duplicates using a set.
-                if len(set(user_inp)) < user_inp_len:
-                    print("You have entered some duplicate countries. Try again.")
-                    continue
-
-                # Check whether all the items in the list correspond are found in self.countries.
-                if not all([c in self.countries for c in user_inp]):
-                    print("You have provided some incorrect names of countries. Try again.")
-                    continue
-
-                return user_inp
-            print(f"The provided input is unexpected (you must enter {('from 1 to ', 'exactly')[strict]} {num}"
-                  f" of countries). Try again.")
+            try:
+                return self.check_countries(input(prompt), num, strict)
+            except ValueError as e:
+                print(f"{e} Try again.")
 
     def extract_to_file(self, countries_req: list, overwrite: bool = False) -> None:
         """
@@ -203,26 +621,28 @@ class AnalysisCSV:
             None
         """
 
-        # Prepare the name for the subset by appending '_subset.csv' to the original CSV filename.
-        subset_filename = self.filename.replace(".csv", "_subset.csv")
+        # Prepare the name for the subset by appending '_subset' to the original CSV filename, before its extension.
+        name, ext = splitext(self.filename)
+        subset_filename = f"{name}_subset{ext}"
 
-        # If the overwrite argument is False and the file already exist, incrementally find the closest free name.
+        # If the overwrite argument is False and the file already exist, find a free name by scanning the directory
+        # once for the numbered subsets ([filename]_subset_[number].csv) and taking the next number after the highest.
         if not overwrite and exists(subset_filename):
-            counter = 0
             name, ext = splitext(subset_filename)
-            while exists(subset_filename):
-                counter += 1
-                subset_filename = f"{name}_{counter}{ext}"
-
-        with open(subset_filename, "w+", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write in the first row (the same for every possible extraction).
-            writer.writerow([self.first_key] + self.data_dict[self.first_key])
-
-            # For each country, write in a concatenation of two lists: the country's name, and the corresponding value.
-            for c in countries_req:
-                writer.writerow([c] + self.data_dict[c])
+            pattern = re.compile(re.escape(basename(name)) + r"_(\d+)" + re.escape(ext) + "$")
+            counter = 0
+            with os.scandir(dirname(name) or ".") as entries:
+                for entry in entries:
+                    match = pattern.match(entry.name)
+                    if match:
+                        counter = max(counter, int(match.group(1)))
+            subset_filename = f"{name}_{counter + 1}{ext}"
+
+        with open(subset_filename, "w", newline="") as csvfile:
+            # Write in the first line (the same for every possible extraction), followed by each country's line,
+            # exactly as they were read from the original file, so that the values keep their formatting.
+            csvfile.writelines(f"{line}\r\n" for line in
+                               chain([self._header], (self._lines[self.data_dict[c]] for c in countries_req)))
 
         print(f"\nData successfully extracted for {', '.join(countries_req)} and saved into the file: "
               f"{subset_filename}.")
@@ -238,21 +658,21 @@ class AnalysisCSV:
             None
         """
 
-        # Convert the first value of the data dictionary to a NumPy array.
-        x_array = np.array(self.data_dict[self.first_key])
+        # Look up the attributes used below only once.
+        years, matrix, data_dict = self.years, self.matrix, self.data_dict
 
-        # Create a list of even years to use as x-axis ticks.
-        x_ticks = [year for year in self.data_dict[self.first_key] if not int(year) % 2]
+        # Select the even years (those with the lowest bit unset) to use as x-axis ticks.
+        x_ticks = years[(years & 1) == 0]
 
-        # Loop through the requested countries and plot their emissions data.
+        # Loop through the requested countries and plot their rows of the matrix.
         for c in countries_req:
-            plt.plot(x_array, np.array([float(k) for k in self.data_dict[c]]), label=c)
+            plt.plot(years, matrix[data_dict[c]], label=c)
 
         # Get the current axes object.
         ax = plt.gca()
 
         # Format the y-axis labels to show two decimal places.
-        ax.yaxis.set_major_formatter(FormatStrFormatter('%.2f'))
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda value, _: f"{value:.2f}"))
 
         # Set the x-axis ticks to the even years.
         ax.set_xticks(x_ticks)
@@ -272,6 +692,36 @@ class AnalysisCSV:
         # Show the plot.
         plt.show()
 
+    def year_summary(self, year: int) -> str:
+        """
+        Finds the countries with the min and max emission levels in a year, and the year's average.
+        Returns a description of the results.
+
+        Args:
+            year (int): A year to analyze.
+
+        Returns:
+            str: The description of the results.
+        """
+
+        # Get the column of the matrix corresponding to the provided year.
+        year_values = self.matrix[:, self._year_to_col[year]]
+
+        # The values that could not be cast into floats are stored as NaN, so they are ignored in the statistics.
+        if np.isnan(year_values).all():
+            return f"There is no valid data for {year}."
+
+        # Find the indices of min & max values in year_values and calculate the annual average in single passes.
+        i_min = int(np.nanargmin(year_values))
+        i_max = int(np.nanargmax(year_values))
+        avg = float(np.nanmean(year_values))
+
+        # Describe the results: the countries at the indices, and the average rounded to six decimal places.
+        countries = self.countries
+        return (f"In {year}, countries with minimum and maximum CO2 emission levels were: "
+                f"[{countries[i_min]}] and [{countries[i_max]}], respectively.\n"
+                f"Average CO2 emissions in {year} were {round(avg, 6)}")
+
     def analyze_year(self, year: int) -> None:
         """
         Finds and displays the countries with the min and max emission levels in a year, and the year's average.
@@ -283,64 +733,118 @@ class AnalysisCSV:
             None
         """
 
-        # Get the provided year's index in self.data_dict.
-        year_index = self.data_dict[self.first_key].index(str(year))
-
-        # Cast all the data associated with that year into float, except for the first key-value pair of self.data_dict.
-        year_values = [float(self.data_dict[k][year_index]) for k in self.data_dict if k != self.first_key]
-
-        # Print the results of the following operations:
-        # Find the indices of min & max values in year_values and get the corresponding countries in self.countries.
-        # Calculate the annual average rounded to six decimal places.
-        print(f"In {year}, countries with minimum and maximum CO2 emission levels were: "
-              f"[{self.countries[year_values.index(min(year_values))]}] "
-              f"and [{self.countries[year_values.index(max(year_values))]}], respectively.\n"
-              f"Average CO2 emissions in {year} were {round(sum(year_values) / len(year_values), 6)}")
+        print(self.year_summary(year))
 
     def verify_structure(self) -> bool:
         """
-        Checks whether the data in the initialized dictionary is of the expected types.
+        Checks whether the data in the initialized object is of the expected types.
 
         Returns:
             bool
         """
 
-        # Enumerate the items in the dictionary to have an easier way of tracking the index.
-        enum_dict = enumerate(self.data_dict.items())
-        for i, e in enum_dict:
+        # Check if each country has any letters, but omit any dashes or spaces.
+        # The first column in the first row is of no consequence to the script, so such a check is omitted.
+        for c in self.countries:
+            if not c.translate(_NAME_PUNCTUATION).isalpha():
+                return False
 
-            # Check if the first row's values can be cast into integers.
-            if i == 0:
-                try:
-                    _ = [int(item) for item in e[1]]
-                except ValueError:
-                    return False
+        # Check if the values of the first row are integers, and the other rows' values are decimal numbers.
+        scan_numbers = _compile_scan_numbers()
+        if scan_numbers is not None:
+            # This is done on the raw bytes of the file, so that no Python objects are created for the values.
+            with open(self.filename, "rb") as csvfile:
+                return bool(scan_numbers(np.frombuffer(csvfile.read(), dtype=np.uint8)))
 
-            else:
-                # Check if the key has any letters, but omit any dashes or spaces.
-                # The first column in the first row is of no consequence to the script, so such a check is omitted.
-                if not e[0].translate(str.maketrans("", "", "-' ")).isalpha():
-                    return False
-
-                # Check if the other rows' values can be cast into floats.
-                try:
-                    _ = [float(item) for item in e[1]]
-                except ValueError:
-                    return False
-        return True
+        # Without Numba, cast the lines read by __init__ instead, without keeping any of the numbers.
+        return _check_numbers(map(_split_line, chain([self._header], self._lines)))
+
+
+def _process_one(job: tuple) -> None:
+    """
+    Analyzes a year in a CSV file and extracts some countries from it, without prompting the user for anything.
+    Defined at the module level, so that it can be run in a separate process.
+
+    Args:
+        job (tuple): The name of a CSV file, a year, a comma-separated string of countries, and the overwrite flag.
+
+    Returns:
+        None
+    """
+
+    filename, year, countries, overwrite = job
+    try:
+        csv_obj = AnalysisCSV(AnalysisCSV.check_file(filename))
+        year = csv_obj.check_year(year)
+        countries = csv_obj.check_countries(countries, 3, False)
+
+        # Prefix each line of the results with the filename, as the output of all the files is interleaved.
+        print("\n".join(f"{filename}: {line}" for line in csv_obj.year_summary(year).splitlines()))
+        csv_obj.extract_to_file(countries, overwrite=overwrite)
+    except (OSError, ValueError) as e:
+        # A file that cannot be read or processed doesn't stop the other files from being processed.
+        print(f"Skipping {filename}: {e}")
 
 
 def main():
-    csv_obj = AnalysisCSV(AnalysisCSV.get_file("Provide the name of the file CSV you wish to read data from: "))
+    # Any of the inputs can be provided as a command-line argument; the user is prompted only for the missing ones.
+    parser = argparse.ArgumentParser(description="Analyze, visualize and extract the data from a CSV file of "
+                                                 "emissions per country.")
+    parser.add_argument("file", nargs="?", help="the name of the CSV file to read data from")
+    parser.add_argument("--year", help="the year to find statistics for")
+    parser.add_argument("--country", help="one or two comma-separated countries to visualize")
+    parser.add_argument("--extract", help="up to three comma-separated countries to extract")
+    parser.add_argument("--overwrite", action="store_true", help="overwrite the existing subset file")
+    parser.add_argument("--batch", help="a file listing the CSV files (one per line) to process in parallel, "
+                                        "using --year and --extract for each of them")
+    args = parser.parse_args()
+
+    # In the batch mode, each file is processed in a separate process, as the files are independent of each other.
+    if args.batch is not None:
+        if args.file is not None or args.country is not None or args.year is None or args.extract is None:
+            parser.error("--batch requires --year and --extract, and no file or --country argument.")
+        try:
+            with open(args.batch) as batch_file:
+                jobs = [(line.strip(), args.year, args.extract, args.overwrite) for line in batch_file if line.strip()]
+        except OSError as e:
+            parser.error(f"The batch file {args.batch} cannot be read ({e.strerror}).")
+        with multiprocessing.Pool() as pool:
+            pool.map(_process_one, jobs)
+        return
+
+    if args.file is None:
+        filename = AnalysisCSV.get_file("Provide the name of the file CSV you wish to read data from: ")
+    else:
+        try:
+            filename = AnalysisCSV.check_file(args.file)
+        except ValueError as e:
+            parser.error(str(e))
+    csv_obj = AnalysisCSV(filename)
+
+    try:
+        year = csv_obj.check_year(args.year) if args.year is not None else None
+        countries = csv_obj.check_countries(args.country, 2, False) if args.country is not None else None
+        extract = csv_obj.check_countries(args.extract, 3, False) if args.extract is not None else None
+    except ValueError as e:
+        parser.error(str(e))
 
     # print(f"Is the file structured as expected? {('No', 'Yes')[csv_obj.verify_structure()]}.")
-    csv_obj.analyze_year(csv_obj.get_year(f"Select a year to find statistics "
-                                          f"({csv_obj.first_value[0]}-{csv_obj.first_value[-1]}): "))
-    csv_obj.visualize(csv_obj.get_country("Select a country to visualize: ", 1))
-    csv_obj.visualize(csv_obj.get_country("Select two comma-separated countries for which you want "
-                                          "to visualize data: ", 2))
-    csv_obj.extract_to_file(csv_obj.get_country("Select up to three comma-separated countries for you want "
-                                                "to extract data: ", 3, False))
+    if year is None:
+        year = csv_obj.get_year(f"Select a year to find statistics "
+                                f"({csv_obj.first_value[0]}-{csv_obj.first_value[-1]}): ")
+    csv_obj.analyze_year(year)
+
+    if countries is not None:
+        csv_obj.visualize(countries)
+    else:
+        csv_obj.visualize(csv_obj.get_country("Select a country to visualize: ", 1))
+        csv_obj.visualize(csv_obj.get_country("Select two comma-separated countries for which you want "
+                                              "to visualize data: ", 2))
+
+    if extract is None:
+        extract = csv_obj.get_country("Select up to three comma-separated countries for you want "
+                                      "to extract data: ", 3, False)
+    csv_obj.extract_to_file(extract, overwrite=args.overwrite)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+"""
+Checks that both ways of verifying the values in EmissionsAnalyzer accept the same files: the Numba-compiled
+byte scanner and casting the values with int() and float().
+
+Run from this directory with: python -m unittest test_EmissionsAnalyzer
+"""
+
+import unittest
+import numpy as np
+import EmissionsAnalyzer
+from importlib.util import find_spec
+
+# The contents of the files to verify, and whether each one is expected to pass.
+CASES = {
+    "plain": ("CO2,1990,1991\nFrance,1.5,-2\nGermany,3,4\n", True),
+    "quoted": ('CO2,1990,1991\n"France","1.5","2"\n', True),
+    "quoted with spaces": ('CO2,1990,1991\nFrance," 1.5",2\n', True),
+    "quoted name with a comma": ('CO2,1990,1991\n"Korea, Rep.",1,2\n', True),
+    "crlf": ("CO2,1990,1991\r\nFrance,1.5,.5\r\nGermany,3,4\r\n", True),
+    "exponent": ("CO2,1990,1991\nFrance,1e3,-2.5E-2\n", True),
+    "exponent without digits": ("CO2,1990,1991\nFrance,1e,2\n", False),
+    "empty cell": ("CO2,1990,1991\nFrance,1,\n", False),
+    "nan and inf": ("CO2,1990,1991\nFrance,nan,-Infinity\nGermany,NaN,inf\n", True),
+    "text": ("CO2,1990,1991\nFrance,1,x\n", False),
+    "decimal year": ("CO2,1990,1991.0\nFrance,1,2\n", False),
+}
+
+
+class TestCheckNumbers(unittest.TestCase):
+
+    def test_casting(self):
+        for name, (contents, expected) in CASES.items():
+            with self.subTest(name):
+                # Split the contents into lines the way AnalysisCSV.__init__ does.
+                lines = [line for line in contents.replace("\r\n", "\n").split("\n") if line]
+                self.assertEqual(EmissionsAnalyzer._check_numbers(map(EmissionsAnalyzer._split_line, lines)), expected)
+
+    @unittest.skipIf(find_spec("numba") is None, "Numba is not installed")
+    def test_numba_scanner(self):
+        scan_numbers = EmissionsAnalyzer._compile_scan_numbers()
+        for name, (contents, expected) in CASES.items():
+            with self.subTest(name):
+                self.assertEqual(bool(scan_numbers(np.frombuffer(contents.encode(), dtype=np.uint8))), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()